@@ -3,6 +3,14 @@ import os
 from datetime import datetime
 import logging
 import threading
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _split_key(key):
+    """Split a dotted setting key into a tuple of path parts (memoized; keys are a small fixed set)."""
+    return tuple(key.split('.'))
+
 
 class ConfigManager:
     """Manages loading, saving, and accessing configuration from JSON with dual-station support."""
@@ -292,6 +300,19 @@ class ConfigManager:
                         migrated = True
                         logging.info(f"Added auto_picker config for {station_id}")
 
+            # Move the debug logging toggle the Options window used to save under
+            # station_1047.settings.debug to the shared key read at startup
+            for station_id, station_data in config['stations'].items():
+                debug = station_data.get('settings', {}).get('debug')
+                if isinstance(debug, dict) and 'enable_debug_logs' in debug:
+                    shared_debug = config.setdefault('shared', {}).setdefault('debug', {})
+                    enabled = bool(debug.pop('enable_debug_logs'))
+                    shared_debug['enable_debug_logs'] = bool(shared_debug.get('enable_debug_logs')) or enabled
+                    if not debug:
+                        del station_data['settings']['debug']
+                    migrated = True
+                    logging.info(f"Moved debug.enable_debug_logs from {station_id} to shared settings")
+
         if migrated:
             logging.info("Configuration migration completed. Saving migrated config.")
             # Save the migrated config
@@ -460,7 +481,7 @@ class ConfigManager:
     def get_station_setting(self, station_id, key, default=None):
         """Get a setting for a specific station using dot notation."""
         try:
-            keys = key.split('.')
+            keys = _split_key(key)
             # Always look under the settings key, but handle 'settings.' prefix for backward compatibility
             value = self.config.get('stations', {}).get(station_id, {}).get('settings', {})
             if keys[0] == 'settings':
@@ -483,7 +504,7 @@ class ConfigManager:
             if 'settings' not in self.config['stations'][station_id]:
                 self.config['stations'][station_id]['settings'] = {}
 
-            keys = key.split('.')
+            keys = _split_key(key)
             d = self.config['stations'][station_id]['settings']
             for k in keys[:-1]:
                 if k not in d:
@@ -602,7 +623,7 @@ class ConfigManager:
     def get_shared_setting(self, key, default=None):
         """Get a shared setting using dot notation."""
         try:
-            keys = key.split('.')
+            keys = _split_key(key)
             value = self.config.get('shared', {})
             for k in keys:
                 value = value[k]
@@ -617,7 +638,7 @@ class ConfigManager:
             if 'shared' not in self.config:
                 self.config['shared'] = {}
             
-            keys = key.split('.')
+            keys = _split_key(key)
             d = self.config['shared']
             for k in keys[:-1]:
                 if k not in d:
@@ -2,43 +2,140 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import ttkthemes
 import logging
+import logging.handlers
 import os
+import errno
+import heapq
+import select
+import socket
 import threading
 import time
-from queue import Queue
-from datetime import datetime
-
-
-class QueueHandler(logging.Handler):
-    """Send logging records to a queue."""
-
-    def __init__(self, log_queue: Queue):
-        super().__init__()
-        self.log_queue = log_queue
-
-    def emit(self, record):
-        try:
-            msg = self.format(record)
-            self.log_queue.put(msg)
-        except Exception:
-            self.handleError(record)
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from functools import partial
+from urllib.parse import urlparse
+
+
+class LogRing:
+    """Bounded ring buffer carrying log lines from handler threads to the GUI.
+
+    Backed by ``collections.deque(maxlen=...)``, whose ``append`` and
+    ``popleft`` are atomic in CPython, so any number of producer threads can
+    push while the Tk thread drains without taking a lock. When the ring is
+    full the oldest lines are dropped and counted in ``dropped``.
+    """
+
+    def __init__(self, size=10000):
+        self._buf = deque(maxlen=size)
+        self.dropped = 0
+
+    def push(self, item):
+        """Append an item, dropping the oldest one if the ring is full."""
+        buf = self._buf
+        if len(buf) == buf.maxlen:
+            # Unlocked, so approximate under concurrent producers - diagnostics only
+            self.dropped += 1
+        buf.append(item)
+
+    def __len__(self):
+        return len(self._buf)
+
+    def drain(self):
+        """Return all items pushed since the last drain, oldest first (single consumer)."""
+        # Producers never shrink the deque, so popping the snapshot length is safe
+        popleft = self._buf.popleft
+        return [popleft() for _ in range(len(self._buf))]
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """Queue raw log records, tagged with their source logger, for the GUI to format.
+
+    Unlike the stdlib handler, ``prepare`` does no formatting: the producer
+    thread only appends a reference and the Tk thread formats when it drains.
+    Producers never call into Tk; the GUI polls the ring on its own timer.
+    """
+
+    def __init__(self, log_queue: LogRing, source):
+        super().__init__(log_queue)
+        self.source = source
+        self._last_error_report = 0.0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        self.queue.push((self.source, record))
+
+    def handleError(self, record):
+        # The stdlib prints a full traceback to stderr for every failure; under a
+        # storm of failing records that stalls the producer threads, so report at
+        # most one per second and drop the rest
+        now = time.monotonic()
+        if now - self._last_error_report >= 1:
+            self._last_error_report = now
+            super().handleError(record)
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs ``strftime`` for ``asctime`` at most once per second.
+
+    Records created within the same second share the formatted date and time;
+    only the milliseconds are filled in per record. Not thread-safe: use from a
+    single thread (the Tk thread here).
+    """
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime(datefmt or self.default_time_format, self.converter(second))
+        if datefmt:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
 
 from config_manager import ConfigManager
 from auto_rds_handler import AutoRDSHandler
 from intro_loader_handler import IntroLoaderHandler
 from ad_scheduler_handler import AdSchedulerHandler
 from auto_picker_handler import AutoPickerHandler
-from ui_config_window import ConfigWindow
-from ui_missing_artists_window import MissingArtistsWindow
-from ui_options_window import OptionsWindow
-from ui_playlist_editor_window import PlaylistEditorWindow
-from ui_ad_inserter_window import AdInserterWindow
 from utils import configure_hidden_subprocess
 from version import get_full_version, get_version
 
+# No log format string in the app uses the thread or process fields, so
+# skip collecting them for every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 class MainApp(tk.Tk):
     """Main application window with GUI for monitoring and configuration - Dual Station Support."""
 
+    # Log widgets keep at most this many lines; trimming waits for the extra
+    # slack to accumulate so the delete only runs occasionally
+    MAX_LOG_LINES = 2000
+    LOG_TRIM_SLACK = 256
+
+    # Interval between polls of the log ring: short while records are arriving;
+    # while it stays empty, doubling from the original 500 ms cadence up to 2 s
+    LOG_POLL_BUSY_MS = 100
+    LOG_POLL_IDLE_MS = 500
+    LOG_POLL_MAX_MS = 2000
+
+    # connect_ex results meaning a non-blocking connect is still under way
+    # (Windows reports WSAEWOULDBLOCK, POSIX EINPROGRESS)
+    _CONNECT_IN_PROGRESS = frozenset(
+        {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, 'WSAEWOULDBLOCK', errno.EWOULDBLOCK)}
+    )
+
+    # Status indicator colours: RDS message status (anything else is gray) and
+    # RadioBoss connectivity (None means not checked yet)
+    RDS_STATUS_COLORS = {'success': 'green', 'timeout': 'red'}
+    CONNECTIVITY_COLORS = {True: 'green', False: 'red', None: 'gray'}
+
     def __init__(self):
         # Configure subprocess to hide windows on Windows before any subprocess usage
         configure_hidden_subprocess()
@@ -72,173 +169,131 @@ class MainApp(tk.Tk):
             
             logging.info("ConfigManager initialized successfully.")
         except Exception as e:
-            logging.error(f"Failed to initialize ConfigManager: {e}")
-            messagebox.showerror("Initialization Error", f"Failed to load configuration: {e}")
-            self.destroy()
+            self._fatal("Initialization Error", "Failed to load configuration", e)
             return
 
-        # Create 6 queues (3 per station)
-        self.rds_1047_queue = Queue()
-        self.intro_1047_queue = Queue()
-        self.ad_1047_queue = Queue()
-        self.rds_887_queue = Queue()
-        self.intro_887_queue = Queue()
-        self.ad_887_queue = Queue()
-        self.auto_picker_queue = Queue()
-
-        # Setup logging for all handlers
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        enable_debug = self.config_manager.get_shared_setting("debug.enable_debug_logs", False)
+        # One log ring shared by every handler; entries are tagged with their logger name
+        self.log_queue = LogRing()
+
+        # Dropped-line count already reported, and when (see process_queues)
+        self._log_drops_reported = 0
+        self._log_drops_reported_at = 0.0
+
+        # Log widgets waiting for the coalesced scroll-to-end
+        self._scroll_pending = set()
+
+        # (epoch second, formatted display timestamp) reused by log batches within a second
+        self._ts_cache = (0, '')
+
+        # Setup logging for all handlers; records are formatted on the Tk thread when the log ring is drained
+        self._log_formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
         log_level = logging.DEBUG if enable_debug else logging.INFO
 
-        # Station 1047 loggers
-        rds_1047_qh = QueueHandler(self.rds_1047_queue)
-        rds_1047_qh.setFormatter(formatter)
-        rds_1047_logger = logging.getLogger('AutoRDS_1047')
-        rds_1047_logger.setLevel(log_level)
-        rds_1047_logger.propagate = False
-        rds_1047_logger.addHandler(rds_1047_qh)
-
-        intro_1047_qh = QueueHandler(self.intro_1047_queue)
-        intro_1047_qh.setFormatter(formatter)
-        intro_1047_logger = logging.getLogger('IntroLoader_1047')
-        intro_1047_logger.setLevel(log_level)
-        intro_1047_logger.propagate = False
-        intro_1047_logger.addHandler(intro_1047_qh)
-
-        ad_1047_qh = QueueHandler(self.ad_1047_queue)
-        ad_1047_qh.setFormatter(formatter)
-        ad_1047_logger = logging.getLogger('AdScheduler_1047')
-        ad_1047_logger.setLevel(log_level)
-        ad_1047_logger.propagate = False
-        ad_1047_logger.addHandler(ad_1047_qh)
-
-        # Station 887 loggers
-        rds_887_qh = QueueHandler(self.rds_887_queue)
-        rds_887_qh.setFormatter(formatter)
-        rds_887_logger = logging.getLogger('AutoRDS_887')
-        rds_887_logger.setLevel(log_level)
-        rds_887_logger.propagate = False
-        rds_887_logger.addHandler(rds_887_qh)
-
-        intro_887_qh = QueueHandler(self.intro_887_queue)
-        intro_887_qh.setFormatter(formatter)
-        intro_887_logger = logging.getLogger('IntroLoader_887')
-        intro_887_logger.setLevel(log_level)
-        intro_887_logger.propagate = False
-        intro_887_logger.addHandler(intro_887_qh)
-
-        ad_887_qh = QueueHandler(self.ad_887_queue)
-        ad_887_qh.setFormatter(formatter)
-        ad_887_logger = logging.getLogger('AdScheduler_887')
-        ad_887_logger.setLevel(log_level)
-        ad_887_logger.propagate = False
-        ad_887_logger.addHandler(ad_887_qh)
-
-        auto_picker_qh = QueueHandler(self.auto_picker_queue)
-        auto_picker_qh.setFormatter(formatter)
-        auto_picker_logger = logging.getLogger('AutoPicker_887')
-        auto_picker_logger.setLevel(log_level)
-        auto_picker_logger.propagate = False
-        auto_picker_logger.addHandler(auto_picker_qh)
+        # Route each handler's logger into the shared log ring
+        for logger_name in ('AutoRDS_1047', 'IntroLoader_1047', 'AdScheduler_1047',
+                            'AutoRDS_887', 'IntroLoader_887', 'AdScheduler_887',
+                            'AutoPicker_887'):
+            self._attach_queue_handler(logger_name, log_level)
 
         # Initialize handlers for both stations
         try:
             # Station 1047 handlers
-            self.rds_1047_handler = AutoRDSHandler(self.rds_1047_queue, self.config_manager, station_id='station_1047')
+            self.rds_1047_handler = AutoRDSHandler(self.log_queue, self.config_manager, station_id='station_1047')
             logging.info("Station 104.7 FM AutoRDSHandler initialized successfully.")
             
-            self.intro_1047_handler = IntroLoaderHandler(self.intro_1047_queue, self.config_manager, station_id='station_1047')
+            self.intro_1047_handler = IntroLoaderHandler(self.log_queue, self.config_manager, station_id='station_1047')
             logging.info("Station 104.7 FM IntroLoaderHandler initialized successfully.")
             
-            self.ad_1047_handler = AdSchedulerHandler(self.ad_1047_queue, self.config_manager, station_id='station_1047')
+            self.ad_1047_handler = AdSchedulerHandler(self.log_queue, self.config_manager, station_id='station_1047')
             logging.info("Station 104.7 FM AdSchedulerHandler initialized successfully.")
 
             # Station 887 handlers
-            self.rds_887_handler = AutoRDSHandler(self.rds_887_queue, self.config_manager, station_id='station_887')
+            self.rds_887_handler = AutoRDSHandler(self.log_queue, self.config_manager, station_id='station_887')
             logging.info("Station 88.7 FM AutoRDSHandler initialized successfully.")
             
-            self.intro_887_handler = IntroLoaderHandler(self.intro_887_queue, self.config_manager, station_id='station_887')
+            self.intro_887_handler = IntroLoaderHandler(self.log_queue, self.config_manager, station_id='station_887')
             logging.info("Station 88.7 FM IntroLoaderHandler initialized successfully.")
             
-            self.ad_887_handler = AdSchedulerHandler(self.ad_887_queue, self.config_manager, station_id='station_887')
+            self.ad_887_handler = AdSchedulerHandler(self.log_queue, self.config_manager, station_id='station_887')
             logging.info("Station 88.7 FM AdSchedulerHandler initialized successfully.")
 
-            self.auto_picker_handler = AutoPickerHandler(self.auto_picker_queue, self.config_manager, station_id='station_887')
+            self.auto_picker_handler = AutoPickerHandler(self.log_queue, self.config_manager, station_id='station_887')
             logging.info("Station 88.7 FM AutoPickerHandler initialized successfully.")
 
+            # (thread name, handler) for every background handler, used to start and stop them
+            self._handlers = [
+                ("RDS_1047", self.rds_1047_handler),
+                ("Intro_1047", self.intro_1047_handler),
+                ("Ad_1047", self.ad_1047_handler),
+                ("RDS_887", self.rds_887_handler),
+                ("Intro_887", self.intro_887_handler),
+                ("Ad_887", self.ad_887_handler),
+                ("AutoPicker_887", self.auto_picker_handler),
+            ]
+
             # Register all handlers as config observers for automatic reload on config changes
             self._register_config_observers()
             logging.info("All handlers registered as config observers.")
             
-        except AttributeError as e:
-            logging.error(f"AttributeError during handler initialization: {e}")
-            messagebox.showerror("Initialization Error", f"Failed to initialize handlers: {e}")
-            self.destroy()
-            return
         except Exception as e:
-            logging.error(f"Unexpected error during handler initialization: {e}")
-            messagebox.showerror("Initialization Error", f"Failed to initialize handlers: {e}")
-            self.destroy()
+            self._fatal("Initialization Error", "Failed to initialize handlers", e)
             return
 
+        # Last value written to each status StringVar, keyed by variable name
+        self._var_values = {}
+
+        # Rows last shown in each message listbox
+        self._listbox_rows = {}
+
         self.create_widgets()
 
         # Initialize auto-scroll tracking (enabled by default)
         self.auto_scroll_enabled = True
 
-        # Start all 6 handlers in threads
+        # Start all handlers in threads
         try:
-            self.rds_1047_thread = threading.Thread(target=self.rds_1047_handler.run, daemon=True, name="RDS_1047")
-            self.intro_1047_thread = threading.Thread(target=self.intro_1047_handler.run, daemon=True, name="Intro_1047")
-            self.ad_1047_thread = threading.Thread(target=self.ad_1047_handler.run, daemon=True, name="Ad_1047")
-            self.rds_887_thread = threading.Thread(target=self.rds_887_handler.run, daemon=True, name="RDS_887")
-            self.intro_887_thread = threading.Thread(target=self.intro_887_handler.run, daemon=True, name="Intro_887")
-            self.ad_887_thread = threading.Thread(target=self.ad_887_handler.run, daemon=True, name="Ad_887")
-            
-            self.auto_picker_thread = threading.Thread(target=self.auto_picker_handler.run, daemon=True, name="AutoPicker_887")
-
-            self.rds_1047_thread.start()
-            self.intro_1047_thread.start()
-            self.ad_1047_thread.start()
-            self.rds_887_thread.start()
-            self.intro_887_thread.start()
-            self.ad_887_thread.start()
-            self.auto_picker_thread.start()
+            # Each handler's run() is a blocking loop, so it keeps a dedicated daemon thread
+            self.handler_threads = {
+                name: threading.Thread(target=handler.run, daemon=True, name=name)
+                for name, handler in self._handlers
+            }
+            for thread in self.handler_threads.values():
+                thread.start()
 
             # Auto-start picking if was_running
             if self.config_manager.get_station_setting('station_887', 'auto_picker.was_running', False):
                 self.auto_picker_handler.start_picking()
 
-            logging.info("All handler threads started successfully.")
-            logging.info("RDS 104.7 thread alive: " + str(self.rds_1047_thread.is_alive()))
-            logging.info("Intro 104.7 thread alive: " + str(self.intro_1047_thread.is_alive()))
-            logging.info("Ad 104.7 thread alive: " + str(self.ad_1047_thread.is_alive()))
-            logging.info("RDS 88.7 thread alive: " + str(self.rds_887_thread.is_alive()))
-            logging.info("Intro 88.7 thread alive: " + str(self.intro_887_thread.is_alive()))
-            logging.info("Ad 88.7 thread alive: " + str(self.ad_887_thread.is_alive()))
+            logging.info("All handler threads started successfully: %s",
+                         ", ".join(f"{name} alive={thread.is_alive()}" for name, thread in self.handler_threads.items()))
         except Exception as e:
-            logging.error(f"Failed to start handler threads: {e}")
-            messagebox.showerror("Thread Error", f"Failed to start handler threads: {e}")
-            self.destroy()
+            self._fatal("Thread Error", "Failed to start handler threads", e)
             return
 
-        # Start periodic GUI updates
-        self.after(500, self.process_queues)
+        # First log drain; process_queues re-arms itself from then on
+        self._log_poll_ms = self.LOG_POLL_IDLE_MS
+        self.after(self._log_poll_ms, self.process_queues)
+
+        # Connectivity per station id (checked in background thread; missing means
+        # not checked yet). The background thread replaces the whole dict and the
+        # UI only reads it; attribute reads/writes are atomic, so no lock is needed.
+        self._radioboss_connected = {}
 
-        # Start background thread for message cycle updates
-        self.message_update_thread = threading.Thread(target=self._message_update_worker, daemon=True, name="MessageUpdate")
-        self.message_update_running = True
-        self.message_update_thread.start()
+        # Seconds until the next connectivity check, backed off while connections are stable
+        self._connectivity_interval = 10
 
-        # Initialize connectivity status cache (checked in background thread)
-        self._radioboss_1047_connected = None
-        self._radioboss_887_connected = None
-        self._connectivity_lock = threading.Lock()
+        # Parsed (host, port) per RadioBoss server URL; keyed by URL so config edits take effect
+        self._radioboss_endpoints = {}
 
-        # Start background thread for connectivity checks (separate from UI updates)
-        self.connectivity_thread = threading.Thread(target=self._connectivity_check_worker, daemon=True, name="ConnectivityCheck")
-        self.connectivity_thread.start()
+        # Message cycle updates and connectivity checks share one background thread
+        self._last_display_messages = None
+        self._pending_display_messages = None
+        self._status_refresh_pending = False
+        # Guards the three fields above, shared with _refresh_status on the Tk thread
+        self._status_handoff_lock = threading.Lock()
+        self._background_stop = threading.Event()
+        self.background_thread = threading.Thread(target=self._background_worker, daemon=True, name="BackgroundTasks")
+        self.background_thread.start()
 
         # Initialize status indicators
         self._update_status_indicators()
@@ -247,11 +302,25 @@ class MainApp(tk.Tk):
         if self.config_manager.get_shared_setting("ui.logs_collapsed", False):
             self.after(100, self._toggle_logs)  # Delay to ensure window is fully rendered
 
+    def _fatal(self, title, message, exc):
+        """Log a startup failure with its traceback, show it, and close the window."""
+        logging.exception(message)
+        messagebox.showerror(title, f"{message}: {exc}")
+        self.destroy()
+
+    def _attach_queue_handler(self, logger_name, log_level):
+        """Send a handler logger's records to the GUI log ring instead of the root logger."""
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(log_level)
+        logger.propagate = False
+        logger.addHandler(QueueHandler(self.log_queue, logger_name))
+
     def _register_config_observers(self):
         """Register all handlers as config observers for automatic reload on config changes."""
         # Define a wrapper that safely reloads all handlers
         def reload_all_handlers():
             logging.info("Config changed - reloading all handler configurations...")
+            reloaded = []
             
             # Reload RDS handlers
             for handler, name in [
@@ -261,9 +330,9 @@ class MainApp(tk.Tk):
                 try:
                     handler.reload_configuration()
                     handler.reload_lecture_detector()
-                    logging.debug(f"{name} handler configuration reloaded.")
+                    reloaded.append(name)
                 except Exception as e:
-                    logging.error(f"Failed to reload {name} handler: {e}")
+                    logging.error("Failed to reload %s handler: %s", name, e)
             
             # Reload Intro Loader handlers
             for handler, name in [
@@ -272,9 +341,9 @@ class MainApp(tk.Tk):
             ]:
                 try:
                     handler.reload_configuration()
-                    logging.debug(f"{name} handler configuration reloaded.")
+                    reloaded.append(name)
                 except Exception as e:
-                    logging.error(f"Failed to reload {name} handler: {e}")
+                    logging.error("Failed to reload %s handler: %s", name, e)
             
             # Reload Ad Scheduler handlers
             for handler, name in [
@@ -283,18 +352,20 @@ class MainApp(tk.Tk):
             ]:
                 try:
                     handler.reload_configuration()
-                    logging.debug(f"{name} handler configuration reloaded.")
+                    reloaded.append(name)
                 except Exception as e:
-                    logging.error(f"Failed to reload {name} handler: {e}")
+                    logging.error("Failed to reload %s handler: %s", name, e)
 
             # Reload Auto Picker handler
             try:
                 self.auto_picker_handler.reload_configuration()
-                logging.debug("Auto Picker 88.7 handler configuration reloaded.")
+                reloaded.append("Auto Picker 88.7")
             except Exception as e:
-                logging.error(f"Failed to reload Auto Picker handler: {e}")
+                logging.error("Failed to reload Auto Picker handler: %s", e)
 
-            logging.info("All handler configurations reloaded successfully.")
+            # One summary line instead of a debug record per handler
+            logging.info("Reloaded %d/%d handler configurations: %s",
+                         len(reloaded), len(self._handlers), ", ".join(reloaded))
         
         # Register the combined reload function as a config observer
         self.config_manager.register_observer(reload_all_handlers)
@@ -334,7 +405,7 @@ Enhanced with XML-Confirmed Ad Reporting
             return
         try:
             # Signal threads to stop (non-blocking - daemon threads will terminate on exit)
-            self.message_update_running = False
+            self._background_stop.set()
 
             # Save auto picker was_running state
             if hasattr(self, 'auto_picker_handler') and self.auto_picker_handler:
@@ -342,21 +413,29 @@ Enhanced with XML-Confirmed Ad Reporting
                     'station_887', 'auto_picker.was_running', self.auto_picker_handler.picking)
                 self.config_manager.save_config(notify_observers=False)
 
-            # Signal all handlers to stop
-            for handler_name in ['rds_1047_handler', 'intro_1047_handler', 'ad_1047_handler',
-                                 'rds_887_handler', 'intro_887_handler', 'ad_887_handler',
-                                 'auto_picker_handler']:
-                if hasattr(self, handler_name):
-                    handler = getattr(self, handler_name)
-                    if handler:
-                        handler.stop()
+            # Stop the background thread posting status refreshes: the Tk loop blocks
+            # below while the handlers stop, and a thread calling into Tk would deadlock
+            self._status_refresh_pending = True
+
+            # Signal all handlers to stop in parallel so slow stops don't add up
+            handlers = [handler for _, handler in getattr(self, '_handlers', [])]
+            if handlers:
+                with ThreadPoolExecutor(max_workers=len(handlers), thread_name_prefix="Shutdown") as pool:
+                    futures = [pool.submit(handler.stop) for handler in handlers]
+                for future in futures:
+                    if future.exception():
+                        logging.error("Error stopping handler: %s", future.exception())
 
         except Exception as e:
-            logging.error(f"Error stopping handlers: {e}")
+            logging.error("Error stopping handlers: %s", e)
         finally:
             self.destroy()
 
     def create_widgets(self):
+        # Oval item id and current fill colour of each status indicator canvas
+        self._indicator_ovals = {}
+        self._indicator_colors = {}
+
         main_frame = ttk.Frame(self, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -393,54 +472,14 @@ Enhanced with XML-Confirmed Ad Reporting
         self.log_notebook.pack(fill=tk.BOTH, expand=True)
 
         # Station 104.7 FM Logs
-        rds_1047_frame = ttk.Frame(self.log_notebook)
-        self.log_notebook.add(rds_1047_frame, text="104.7 AutoRDS")
-        self.rds_1047_log_text = tk.Text(rds_1047_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        rds_1047_scroll = ttk.Scrollbar(rds_1047_frame, orient=tk.VERTICAL, command=self.rds_1047_log_text.yview)
-        self.rds_1047_log_text.config(yscrollcommand=rds_1047_scroll.set)
-        rds_1047_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.rds_1047_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        intro_1047_frame = ttk.Frame(self.log_notebook)
-        self.log_notebook.add(intro_1047_frame, text="104.7 Intro Loader")
-        self.intro_1047_log_text = tk.Text(intro_1047_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        intro_1047_scroll = ttk.Scrollbar(intro_1047_frame, orient=tk.VERTICAL, command=self.intro_1047_log_text.yview)
-        self.intro_1047_log_text.config(yscrollcommand=intro_1047_scroll.set)
-        intro_1047_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.intro_1047_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        ad_1047_frame = ttk.Frame(self.log_notebook)
-        self.log_notebook.add(ad_1047_frame, text="104.7 Ad Scheduler")
-        self.ad_1047_log_text = tk.Text(ad_1047_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        ad_1047_scroll = ttk.Scrollbar(ad_1047_frame, orient=tk.VERTICAL, command=self.ad_1047_log_text.yview)
-        self.ad_1047_log_text.config(yscrollcommand=ad_1047_scroll.set)
-        ad_1047_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.ad_1047_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.rds_1047_log_text = self._make_log_tab("104.7 AutoRDS")
+        self.intro_1047_log_text = self._make_log_tab("104.7 Intro Loader")
+        self.ad_1047_log_text = self._make_log_tab("104.7 Ad Scheduler")
 
         # Station 88.7 FM Logs
-        rds_887_frame = ttk.Frame(self.log_notebook)
-        self.log_notebook.add(rds_887_frame, text="88.7 AutoRDS")
-        self.rds_887_log_text = tk.Text(rds_887_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        rds_887_scroll = ttk.Scrollbar(rds_887_frame, orient=tk.VERTICAL, command=self.rds_887_log_text.yview)
-        self.rds_887_log_text.config(yscrollcommand=rds_887_scroll.set)
-        rds_887_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.rds_887_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        intro_887_frame = ttk.Frame(self.log_notebook)
-        self.log_notebook.add(intro_887_frame, text="88.7 Intro Loader")
-        self.intro_887_log_text = tk.Text(intro_887_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        intro_887_scroll = ttk.Scrollbar(intro_887_frame, orient=tk.VERTICAL, command=self.intro_887_log_text.yview)
-        self.intro_887_log_text.config(yscrollcommand=intro_887_scroll.set)
-        intro_887_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.intro_887_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        ad_887_frame = ttk.Frame(self.log_notebook)
-        self.log_notebook.add(ad_887_frame, text="88.7 Ad Scheduler")
-        self.ad_887_log_text = tk.Text(ad_887_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        ad_887_scroll = ttk.Scrollbar(ad_887_frame, orient=tk.VERTICAL, command=self.ad_887_log_text.yview)
-        self.ad_887_log_text.config(yscrollcommand=ad_887_scroll.set)
-        ad_887_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.ad_887_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.rds_887_log_text = self._make_log_tab("88.7 AutoRDS")
+        self.intro_887_log_text = self._make_log_tab("88.7 Intro Loader")
+        self.ad_887_log_text = self._make_log_tab("88.7 Ad Scheduler")
 
         # 88.7 Auto Picker Log Tab with button bar
         auto_picker_outer_frame = ttk.Frame(self.log_notebook)
@@ -463,16 +502,36 @@ Enhanced with XML-Confirmed Ad Reporting
         # Log text widget
         auto_picker_log_frame = ttk.Frame(auto_picker_outer_frame)
         auto_picker_log_frame.pack(fill=tk.BOTH, expand=True)
-        self.auto_picker_log_text = tk.Text(auto_picker_log_frame, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9))
-        auto_picker_scroll = ttk.Scrollbar(auto_picker_log_frame, orient=tk.VERTICAL, command=self.auto_picker_log_text.yview)
-        self.auto_picker_log_text.config(yscrollcommand=auto_picker_scroll.set)
-        auto_picker_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.auto_picker_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.auto_picker_log_text = self._make_log_text(auto_picker_log_frame)
+
+        # Log widgets keyed by logger name, in notebook tab order
+        self.log_widgets = {
+            'AutoRDS_1047': self.rds_1047_log_text,
+            'IntroLoader_1047': self.intro_1047_log_text,
+            'AdScheduler_1047': self.ad_1047_log_text,
+            'AutoRDS_887': self.rds_887_log_text,
+            'IntroLoader_887': self.intro_887_log_text,
+            'AdScheduler_887': self.ad_887_log_text,
+            'AutoPicker_887': self.auto_picker_log_text
+        }
+
+        # Only the selected tab formats records as they arrive; the others hold
+        # parked records (see _park_log_record), no more than a full widget's
+        # worth, until they are selected
+        self._log_sources = list(self.log_widgets)
+        self._visible_log_source = self._log_sources[0]
+        self._hidden_log_records = {source: deque(maxlen=self.MAX_LOG_LINES) for source in self._log_sources}
+
+        # Raw Tcl commands for the drain path, bound once per widget: (set state, append text).
+        # They skip the option-dict and argument handling of the Text.config/insert wrappers.
+        self._log_widget_methods = {
+            widget: (partial(widget.tk.call, str(widget), 'configure', '-state'),
+                     partial(widget.tk.call, str(widget), 'insert', 'end'))
+            for widget in self.log_widgets.values()
+        }
 
         # Configure search highlight tag on all log widgets
-        for widget in [self.rds_1047_log_text, self.intro_1047_log_text, self.ad_1047_log_text,
-                       self.rds_887_log_text, self.intro_887_log_text, self.ad_887_log_text,
-                       self.auto_picker_log_text]:
+        for widget in self.log_widgets.values():
             widget.tag_config("search_highlight", background="yellow", foreground="black")
             widget.tag_config("search_current", background="orange", foreground="black")
 
@@ -523,9 +582,7 @@ Enhanced with XML-Confirmed Ad Reporting
         rds_1047_status_frame = ttk.Frame(station_1047_frame)
         rds_1047_status_frame.pack(fill=tk.X, pady=(0, 2))
 
-        self.rds_1047_status_canvas = tk.Canvas(rds_1047_status_frame, width=16, height=16, bg=self.cget('bg'), highlightthickness=0)
-        self.rds_1047_status_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self.rds_1047_status_canvas.create_oval(2, 2, 14, 14, fill='gray', outline='')
+        self.rds_1047_status_canvas = self._make_status_dot(rds_1047_status_frame)
 
         ttk.Label(rds_1047_status_frame, text="RDS:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
         self.current_rds_1047_var = tk.StringVar(value="Waiting for first message...")
@@ -536,9 +593,7 @@ Enhanced with XML-Confirmed Ad Reporting
         radioboss_1047_status_frame = ttk.Frame(station_1047_frame)
         radioboss_1047_status_frame.pack(fill=tk.X, pady=(2, 0))
 
-        self.radioboss_1047_status_canvas = tk.Canvas(radioboss_1047_status_frame, width=16, height=16, bg=self.cget('bg'), highlightthickness=0)
-        self.radioboss_1047_status_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self.radioboss_1047_status_canvas.create_oval(2, 2, 14, 14, fill='gray', outline='')
+        self.radioboss_1047_status_canvas = self._make_status_dot(radioboss_1047_status_frame)
 
         ttk.Label(radioboss_1047_status_frame, text="RadioBoss:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
         ttk.Label(radioboss_1047_status_frame, text="Connection Status", font=("Segoe UI", 9, "bold")).pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -560,9 +615,7 @@ Enhanced with XML-Confirmed Ad Reporting
         rds_887_status_frame = ttk.Frame(station_887_frame)
         rds_887_status_frame.pack(fill=tk.X, pady=(0, 2))
 
-        self.rds_887_status_canvas = tk.Canvas(rds_887_status_frame, width=16, height=16, bg=self.cget('bg'), highlightthickness=0)
-        self.rds_887_status_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self.rds_887_status_canvas.create_oval(2, 2, 14, 14, fill='gray', outline='')
+        self.rds_887_status_canvas = self._make_status_dot(rds_887_status_frame)
 
         ttk.Label(rds_887_status_frame, text="RDS:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
         self.current_rds_887_var = tk.StringVar(value="Waiting for first message...")
@@ -573,9 +626,7 @@ Enhanced with XML-Confirmed Ad Reporting
         radioboss_887_status_frame = ttk.Frame(station_887_frame)
         radioboss_887_status_frame.pack(fill=tk.X, pady=(2, 0))
 
-        self.radioboss_887_status_canvas = tk.Canvas(radioboss_887_status_frame, width=16, height=16, bg=self.cget('bg'), highlightthickness=0)
-        self.radioboss_887_status_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self.radioboss_887_status_canvas.create_oval(2, 2, 14, 14, fill='gray', outline='')
+        self.radioboss_887_status_canvas = self._make_status_dot(radioboss_887_status_frame)
 
         ttk.Label(radioboss_887_status_frame, text="RadioBoss:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
         ttk.Label(radioboss_887_status_frame, text="Connection Status", font=("Segoe UI", 9, "bold")).pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -584,9 +635,7 @@ Enhanced with XML-Confirmed Ad Reporting
         auto_picker_status_frame = ttk.Frame(station_887_frame)
         auto_picker_status_frame.pack(fill=tk.X, pady=(2, 0))
 
-        self.auto_picker_status_canvas = tk.Canvas(auto_picker_status_frame, width=16, height=16, bg=self.cget('bg'), highlightthickness=0)
-        self.auto_picker_status_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self.auto_picker_status_canvas.create_oval(2, 2, 14, 14, fill='gray', outline='')
+        self.auto_picker_status_canvas = self._make_status_dot(auto_picker_status_frame)
 
         ttk.Label(auto_picker_status_frame, text="Auto Picker:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
         self.auto_picker_seq_var = tk.StringVar(value="Stopped")
@@ -598,14 +647,54 @@ Enhanced with XML-Confirmed Ad Reporting
         self.auto_picker_counts_var = tk.StringVar(value="")
         ttk.Label(auto_picker_counts_frame, textvariable=self.auto_picker_counts_var, font=("Segoe UI", 8)).pack(side=tk.LEFT, padx=(21, 0))
 
+        # (label, status getter, canvas, message var) for each RDS status row
+        self._rds_status_rows = [
+            ("1047", self.rds_1047_handler.get_current_message_status, self.rds_1047_status_canvas, self.current_rds_1047_var),
+            ("887", self.rds_887_handler.get_current_message_status, self.rds_887_status_canvas, self.current_rds_887_var),
+        ]
+
+        # (label, station id, canvas) for each RadioBoss connectivity row
+        self._radioboss_status_rows = [
+            ("1047", 'station_1047', self.radioboss_1047_status_canvas),
+            ("887", 'station_887', self.radioboss_887_status_canvas),
+        ]
+
+    def _make_status_dot(self, parent):
+        """Pack a gray status indicator dot into parent and return its canvas."""
+        canvas = tk.Canvas(parent, width=16, height=16, bg=self.cget('bg'), highlightthickness=0)
+        canvas.pack(side=tk.LEFT, padx=(0, 5))
+        self._indicator_ovals[canvas] = canvas.create_oval(2, 2, 14, 14, fill='gray', outline='')
+        self._indicator_colors[canvas] = 'gray'
+        return canvas
+
+    def _make_log_tab(self, title):
+        """Add a notebook tab holding a log text widget and return the widget."""
+        frame = ttk.Frame(self.log_notebook)
+        self.log_notebook.add(frame, text=title)
+        return self._make_log_text(frame)
+
+    def _make_log_text(self, parent):
+        """Create a read-only log text widget with a vertical scrollbar in parent."""
+        # Append-only, so no undo history is wanted
+        text = tk.Text(parent, wrap=tk.WORD, state=tk.DISABLED, height=10, font=("Consolas", 9),
+                       undo=False, autoseparators=False, maxundo=0)
+        scroll = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=text.yview)
+        text.config(yscrollcommand=scroll.set)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        return text
+
     def open_config_window(self):
         """Open the message configuration window."""
+        from ui_config_window import ConfigWindow
         ConfigWindow(self, self.config_manager)
 
     def open_missing_artists_window(self):
+        from ui_missing_artists_window import MissingArtistsWindow
         MissingArtistsWindow(self, self.intro_1047_handler, self.intro_887_handler, self.config_manager)
 
     def open_options_window(self):
+        from ui_options_window import OptionsWindow
         OptionsWindow(self, self.config_manager,
                      self.intro_1047_handler, self.intro_887_handler,
                      self.rds_1047_handler, self.rds_887_handler,
@@ -613,10 +702,12 @@ Enhanced with XML-Confirmed Ad Reporting
                      auto_picker_handler=self.auto_picker_handler)
 
     def open_playlist_editor_window(self):
+        from ui_playlist_editor_window import PlaylistEditorWindow
         PlaylistEditorWindow(self, self.config_manager)
 
     def open_ad_inserter_window(self):
         """Open the ad inserter window with tabs for both stations."""
+        from ui_ad_inserter_window import AdInserterWindow
         AdInserterWindow(self, self.config_manager)
 
     def open_ad_statistics_window(self):
@@ -625,256 +716,422 @@ Enhanced with XML-Confirmed Ad Reporting
         AdStatisticsWindow(self, self.config_manager)
 
     def process_queues(self):
-        """Processes messages from all queues to update GUI."""
-        # Collect messages for batch processing
-        log_batches = {
-            self.rds_1047_log_text: [],
-            self.intro_1047_log_text: [],
-            self.ad_1047_log_text: [],
-            self.rds_887_log_text: [],
-            self.intro_887_log_text: [],
-            self.ad_887_log_text: [],
-            self.auto_picker_log_text: []
-        }
-
-        updated = False
-
-        # Station 1047 queues
-        while not self.rds_1047_queue.empty():
-            message = self.rds_1047_queue.get()
-            log_batches[self.rds_1047_log_text].append(message)
-            updated = True
-
-        while not self.intro_1047_queue.empty():
-            message = self.intro_1047_queue.get()
-            log_batches[self.intro_1047_log_text].append(message)
-            updated = True
-
-        while not self.ad_1047_queue.empty():
-            message = self.ad_1047_queue.get()
-            log_batches[self.ad_1047_log_text].append(message)
-            updated = True
-
-        # Station 887 queues
-        while not self.rds_887_queue.empty():
-            message = self.rds_887_queue.get()
-            log_batches[self.rds_887_log_text].append(message)
-            updated = True
-
-        while not self.intro_887_queue.empty():
-            message = self.intro_887_queue.get()
-            log_batches[self.intro_887_log_text].append(message)
-            updated = True
-
-        while not self.ad_887_queue.empty():
-            message = self.ad_887_queue.get()
-            log_batches[self.ad_887_log_text].append(message)
-            updated = True
-
-        while not self.auto_picker_queue.empty():
-            message = self.auto_picker_queue.get()
-            log_batches[self.auto_picker_log_text].append(message)
-            updated = True
-
-        # Batch update all log widgets
-        if updated:
-            for widget, messages in log_batches.items():
-                if messages:
-                    self._log_messages_batch(widget, messages)
-
-            # Only auto-scroll if enabled (not paused by user scrolling)
-            if self.auto_scroll_enabled:
-                for widget in [self.rds_1047_log_text, self.intro_1047_log_text, self.ad_1047_log_text,
-                               self.rds_887_log_text, self.intro_887_log_text, self.ad_887_log_text,
-                               self.auto_picker_log_text]:
-                    widget.see(tk.END)
-
-        self.after(500, self.process_queues)
-
-    def _message_update_worker(self):
-        """Background worker thread that periodically updates message cycles."""
-        while self.message_update_running:
-            try:
-                # Update message cycles for both stations
-                messages_1047 = self.rds_1047_handler.get_current_display_messages()
-                messages_887 = self.rds_887_handler.get_current_display_messages()
-
-                # Schedule UI update on main thread
-                self.after(0, lambda: self._update_message_lists(messages_1047, messages_887))
-
-                # Also update status indicators more frequently
-                self.after(0, lambda: self._update_status_indicators())
+        """Poll the log ring and drain it into the widgets, then re-arm (runs on the Tk thread)."""
+        # Producers only push to the ring and never wait on Tk, so the GUI polls.
+        # An empty ring costs one len() per tick.
+        # Back off while idle; the first poll to find records resets the interval
+        delay = min(max(self._log_poll_ms * 2, self.LOG_POLL_IDLE_MS), self.LOG_POLL_MAX_MS)
+        try:
+            if self.log_queue:
+                self._drain_log_ring()
+                delay = self.LOG_POLL_BUSY_MS
+        finally:
+            self._log_poll_ms = delay
+            self.after(delay, self.process_queues)
+
+    def _drain_log_ring(self):
+        """Move everything in the log ring into the log widgets."""
+        # Only the selected tab's records are formatted now. Records for hidden
+        # tabs are parked and formatted when their tab is selected.
+        visible = self._visible_log_source
+        hidden = self._hidden_log_records
+        format_line = self._format_log_line
+        park = self._park_log_record
+        lines = []
+        for source, record in self.log_queue.drain():
+            if source == visible:
+                lines.append(format_line(record))
+            else:
+                hidden[source].append(park(record))
+
+        # Report lines lost to a full ring (GUI stalled), at most once per second
+        dropped = self.log_queue.dropped
+        if dropped != self._log_drops_reported and time.monotonic() - self._log_drops_reported_at >= 1:
+            logging.debug("Log ring full - dropped %d GUI log lines", dropped - self._log_drops_reported)
+            self._log_drops_reported = dropped
+            self._log_drops_reported_at = time.monotonic()
+
+        if lines:
+            widget = self.log_widgets[visible]
+            self._schedule_scroll_to_end(widget)
+            self._log_messages_batch(widget, lines)
+
+    def _flush_hidden_logs(self, source):
+        """Format and insert the records that arrived while a log tab was hidden."""
+        records = self._hidden_log_records[source]
+        if not records:
+            return
+        lines = [self._format_log_line(record) for record in records]
+        records.clear()
+        widget = self.log_widgets[source]
+        self._schedule_scroll_to_end(widget)
+        self._log_messages_batch(widget, lines)
+
+    def _format_log_line(self, record):
+        """Format a log record as a display line stamped with its creation time."""
+        try:
+            message = self._log_formatter.format(record)
+        except Exception:
+            message = self._unformattable_message(record)
+        return f"[{self._log_timestamp(record.created)}] {message}\n"
+
+    def _park_log_record(self, record):
+        """Reduce a record for a hidden tab to plain strings before it is held.
+
+        ``msg % args`` is resolved now so the line shows the arguments as they
+        were when logged, and any traceback is rendered to ``exc_text`` so the
+        held record no longer keeps frames and their locals alive. Timestamp
+        and line formatting still wait until the tab is shown.
+        """
+        # Records reach only this handler (propagate is off), so they are
+        # stripped in place, as the stdlib QueueHandler.prepare does to its copy
+        try:
+            record.msg = record.getMessage()
+        except Exception:
+            record.msg = self._unformattable_message(record)
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._log_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    @staticmethod
+    def _unformattable_message(record):
+        """Placeholder text for a record whose message can't be formatted."""
+        # Bad %-args, or a msg object whose str() raises - repr() of such an
+        # object may raise too, so only show the message when it's a string
+        msg = record.msg
+        shown = repr(msg) if isinstance(msg, str) else f"<{type(msg).__name__} object>"
+        return f"<unformattable log record: {shown}>"
+
+    def _schedule_scroll_to_end(self, widget):
+        """Queue an auto-scroll for widget, coalesced into a single after_idle pass.
+
+        Call before inserting: the widget only follows new lines if its view is
+        at the bottom, so a user reading further up keeps their position.
+        """
+        # Scrolling forces a line-metrics pass, so further drains before the
+        # idle callback runs only add to the pending set
+        if not self.auto_scroll_enabled or widget.yview()[1] < 0.98:
+            return
+        if not self._scroll_pending:
+            self.after_idle(self._scroll_pending_to_end)
+        self._scroll_pending.add(widget)
+
+    def _scroll_pending_to_end(self):
+        """Scroll the log widgets that received lines since the last call to their end."""
+        pending = self._scroll_pending
+        self._scroll_pending = set()
+        if self.auto_scroll_enabled:
+            for widget in pending:
+                widget.see(tk.END)
+
+    def _background_worker(self):
+        """Background thread running the periodic tasks, each on its own interval."""
+        # Heap of (next run time, order, period in seconds, task); the order
+        # field keeps entries comparable when two tasks fall due together.
+        # A task may return a delay to use instead of its period for the next run.
+        now = time.monotonic()
+        schedule = [(now, 0, 5, self._update_message_cycles),
+                    (now, 1, 10, self._check_connectivity)]
+        while not self._background_stop.is_set():
+            due, order, period, task = schedule[0]
+            # Sleep until the earliest task is due; close wakes the wait at once
+            if self._background_stop.wait(max(0.0, due - time.monotonic())):
+                break
+            delay = task() or period
+            heapq.heapreplace(schedule, (time.monotonic() + delay, order, period, task))
 
-            except Exception as e:
-                logging.error(f"Error in message update worker: {e}")
+    def _update_message_cycles(self):
+        """Refresh the message cycles and status indicators (runs every 5 seconds)."""
+        try:
+            # Update message cycles for both stations
+            messages_1047 = self.rds_1047_handler.get_current_display_messages()
+            messages_887 = self.rds_887_handler.get_current_display_messages()
+
+            # Hand the cycles to the main thread only when they changed. They stay
+            # pending until _refresh_status takes them under the same lock.
+            messages = (messages_1047, messages_887)
+            with self._status_handoff_lock:
+                if messages != self._last_display_messages:
+                    self._last_display_messages = messages
+                    self._pending_display_messages = messages
+
+                # Also update status indicators more frequently; if the Tk loop has
+                # fallen behind, one pending refresh covers any number of runs
+                schedule = not self._status_refresh_pending
+                self._status_refresh_pending = True
+
+            # Outside the lock: with threaded Tcl, after_idle waits for the Tk thread
+            if schedule:
+                try:
+                    self.after_idle(self._refresh_status)
+                except (RuntimeError, tk.TclError):
+                    # Main loop not running yet, or the window is closing - retry next run
+                    with self._status_handoff_lock:
+                        self._status_refresh_pending = False
 
-            # Sleep for 5 seconds before next update
-            time.sleep(5)
+        except Exception as e:
+            logging.error("Error in message update worker: %s", e)
 
-    def _connectivity_check_worker(self):
-        """Background worker that periodically checks RadioBoss connectivity."""
-        import socket
-        from urllib.parse import urlparse
-        
-        while self.message_update_running:
-            try:
-                # Check Station 1047
-                connected_1047 = self._do_connectivity_check('station_1047')
-                # Check Station 887
-                connected_887 = self._do_connectivity_check('station_887')
-                
-                # Update cached values thread-safely
-                with self._connectivity_lock:
-                    self._radioboss_1047_connected = connected_1047
-                    self._radioboss_887_connected = connected_887
-                    
-            except Exception as e:
-                logging.error(f"Error in connectivity check worker: {e}")
-            
-            # Check every 10 seconds (reasonable interval for connectivity monitoring)
-            time.sleep(10)
-    
-    def _do_connectivity_check(self, station_id):
-        """Perform the actual connectivity check (runs in background thread)."""
-        import socket
-        from urllib.parse import urlparse
-        
+    def _check_connectivity(self):
+        """Check RadioBoss connectivity for both stations; returns the delay before the next check."""
         try:
-            # Get the RadioBoss API server URL (e.g., "http://192.168.3.12:9000")
-            server_url = self.config_manager.get_station_setting(station_id, "radioboss.server")
+            # Probe both stations at once, so an unreachable one doesn't delay the other
+            connected = self._do_connectivity_check(('station_1047', 'station_887'))
 
-            # Parse the URL to extract IP and port
-            parsed = urlparse(server_url)
-            host = parsed.hostname
-            port = parsed.port or 80  # Default to port 80 if not specified
+            # Publish the new results to the UI thread in one assignment
+            stable = connected == self._radioboss_connected
+            self._radioboss_connected = connected
 
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(3)  # 3 second timeout (reduced from 5)
-            result = sock.connect_ex((host, port))
-            sock.close()
+            # Back off while both stations stay connected; check every 10 seconds
+            # again as soon as anything changes or a station is unreachable
+            if stable and all(connected.values()):
+                self._connectivity_interval = min(self._connectivity_interval * 2, 30)
+            else:
+                self._connectivity_interval = 10
+            return self._connectivity_interval
 
-            return result == 0  # 0 means connection successful
         except Exception as e:
-            logging.debug(f"Connectivity check failed for {station_id}: {e}")
-            return False
-
-    def _update_status_indicators(self):
-        """Update the status indicator circles for both stations."""
-        try:
-            # Station 1047
-            status_1047 = self.rds_1047_handler.get_current_message_status()
-            color_1047 = 'green' if status_1047['status'] == 'success' else 'red' if status_1047['status'] == 'timeout' else 'gray'
-            self.rds_1047_status_canvas.itemconfig(1, fill=color_1047)
+            logging.error("Error in connectivity check worker: %s", e)
 
-            if status_1047['message']:
-                self.current_rds_1047_var.set(status_1047['message'])
-        except Exception as e:
-            self.rds_1047_status_canvas.itemconfig(1, fill='gray')
-            logging.error(f"Error updating 1047 status indicator: {e}")
+    def _do_connectivity_check(self, station_ids):
+        """Perform the actual connectivity checks (runs in background thread).
 
+        Starts a non-blocking connect to every station's RadioBoss server and waits
+        on all of them together for up to 3 seconds; returns {station_id: connected}.
+        """
+        connected = dict.fromkeys(station_ids, False)
+        pending = {}
         try:
-            # Station 887
-            status_887 = self.rds_887_handler.get_current_message_status()
-            color_887 = 'green' if status_887['status'] == 'success' else 'red' if status_887['status'] == 'timeout' else 'gray'
-            self.rds_887_status_canvas.itemconfig(1, fill=color_887)
+            for station_id in station_ids:
+                sock = None
+                try:
+                    # Get the RadioBoss API server URL (e.g., "http://192.168.3.12:9000")
+                    server_url = self.config_manager.get_station_setting(station_id, "radioboss.server")
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.setblocking(False)
+                    result = sock.connect_ex(self._radioboss_endpoint(server_url))
+                except Exception as e:
+                    logging.debug("Connectivity check failed for %s: %s", station_id, e)
+                    if sock is not None:
+                        sock.close()
+                    continue
+                if result == 0:
+                    connected[station_id] = True
+                    sock.close()
+                elif result in self._CONNECT_IN_PROGRESS:
+                    pending[sock] = station_id
+                else:
+                    logging.debug("Connectivity check failed for %s: %s", station_id, os.strerror(result))
+                    sock.close()
+
+            # Closing right away is enough to prove reachability
+            deadline = time.monotonic() + 3
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _, writable, failed = select.select([], list(pending), list(pending), remaining)
+                for sock in set(writable) | set(failed):
+                    station_id = pending.pop(sock)
+                    error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    connected[station_id] = error == 0
+                    if error:
+                        logging.debug("Connectivity check failed for %s: %s", station_id, os.strerror(error))
+                    sock.close()
+
+            for station_id in pending.values():
+                logging.debug("Connectivity check failed for %s: timed out", station_id)
+        finally:
+            for sock in pending:
+                sock.close()
+        return connected
+
+    def _radioboss_endpoint(self, server_url):
+        """Return (host, port) for a RadioBoss server URL, parsing each distinct URL once."""
+        endpoint = self._radioboss_endpoints.get(server_url)
+        if endpoint is None:
+            parsed = urlparse(server_url)
+            endpoint = (parsed.hostname, parsed.port or 80)  # Default to port 80 if not specified
+            self._radioboss_endpoints[server_url] = endpoint
+        return endpoint
+
+    def _refresh_status(self):
+        """Apply the latest message cycles and status indicators (runs on the Tk thread)."""
+        with self._status_handoff_lock:
+            self._status_refresh_pending = False
+            messages, self._pending_display_messages = self._pending_display_messages, None
+        if messages is not None:
+            self._update_message_lists(*messages)
+        self._update_status_indicators()
 
-            if status_887['message']:
-                self.current_rds_887_var.set(status_887['message'])
-        except Exception as e:
-            self.rds_887_status_canvas.itemconfig(1, fill='gray')
-            logging.error(f"Error updating 887 status indicator: {e}")
+    def _update_status_indicators(self):
+        """Update the status indicator circles for both stations."""
+        rds_colors = self.RDS_STATUS_COLORS
+        for label, get_status, canvas, var in self._rds_status_rows:
+            try:
+                status = get_status()
+                self._set_indicator(canvas, rds_colors.get(status['status'], 'gray'))
 
-        # Update RadioBoss connectivity indicators (using cached values from background thread)
-        try:
-            with self._connectivity_lock:
-                connected_1047 = self._radioboss_1047_connected
-            radioboss_1047_color = 'green' if connected_1047 else 'red' if connected_1047 is False else 'gray'
-            self.radioboss_1047_status_canvas.itemconfig(1, fill=radioboss_1047_color)
-        except Exception as e:
-            self.radioboss_1047_status_canvas.itemconfig(1, fill='gray')
-            logging.error(f"Error updating RadioBoss 1047 connectivity indicator: {e}")
+                if status['message']:
+                    self._set_if_changed(var, status['message'])
+            except Exception as e:
+                self._set_indicator(canvas, 'gray')
+                logging.error("Error updating %s status indicator: %s", label, e)
 
-        try:
-            with self._connectivity_lock:
-                connected_887 = self._radioboss_887_connected
-            radioboss_887_color = 'green' if connected_887 else 'red' if connected_887 is False else 'gray'
-            self.radioboss_887_status_canvas.itemconfig(1, fill=radioboss_887_color)
-        except Exception as e:
-            self.radioboss_887_status_canvas.itemconfig(1, fill='gray')
-            logging.error(f"Error updating RadioBoss 887 connectivity indicator: {e}")
+        # Update RadioBoss connectivity indicators (using cached values from background thread)
+        connected = self._radioboss_connected
+        for label, station_id, canvas in self._radioboss_status_rows:
+            try:
+                self._set_indicator(canvas, self.CONNECTIVITY_COLORS[connected.get(station_id)])
+            except Exception as e:
+                self._set_indicator(canvas, 'gray')
+                logging.error("Error updating RadioBoss %s connectivity indicator: %s", label, e)
 
         # Auto Picker status
         try:
             ap_status = self.auto_picker_handler.get_status()
             ap_color = 'green' if ap_status['running'] else 'red'
-            self.auto_picker_status_canvas.itemconfig(1, fill=ap_color)
+            self._set_indicator(self.auto_picker_status_canvas, ap_color)
             # Build sequence: [Picked] upcoming...
             picked_folder = ap_status.get('last_picked_folder')
             next_text = ap_status['next_cycle_text']
             if not ap_status['running']:
-                self.auto_picker_seq_var.set("Stopped")
+                self._set_if_changed(self.auto_picker_seq_var, "Stopped")
             elif picked_folder:
                 seq = f"[{picked_folder}] {next_text}" if next_text else f"[{picked_folder}]"
-                self.auto_picker_seq_var.set(seq)
+                self._set_if_changed(self.auto_picker_seq_var, seq)
             elif next_text:
-                self.auto_picker_seq_var.set(next_text)
+                self._set_if_changed(self.auto_picker_seq_var, next_text)
             else:
-                self.auto_picker_seq_var.set("")
+                self._set_if_changed(self.auto_picker_seq_var, "")
             song_count = ap_status['folder_a_count']
             shiur_count = ap_status['folder_b_count']
             if song_count or shiur_count:
-                self.auto_picker_counts_var.set(f"({song_count} songs, {shiur_count} shiurim)")
+                self._set_if_changed(self.auto_picker_counts_var, f"({song_count} songs, {shiur_count} shiurim)")
             else:
-                self.auto_picker_counts_var.set("")
+                self._set_if_changed(self.auto_picker_counts_var, "")
             # Sync the toggle button text
             if hasattr(self, 'auto_picker_toggle_btn'):
                 expected_text = "Stop" if ap_status['running'] else "Start"
                 if self.auto_picker_toggle_btn.cget('text') != expected_text:
                     self.auto_picker_toggle_btn.config(text=expected_text)
         except Exception as e:
-            self.auto_picker_status_canvas.itemconfig(1, fill='gray')
-            logging.error(f"Error updating Auto Picker indicator: {e}")
+            self._set_indicator(self.auto_picker_status_canvas, 'gray')
+            logging.error("Error updating Auto Picker indicator: %s", e)
+
+    def _set_indicator(self, canvas, color):
+        """Recolour a status indicator's dot, skipping the Tcl call when the colour is unchanged."""
+        if self._indicator_colors.get(canvas) != color:
+            self._indicator_colors[canvas] = color
+            canvas.itemconfig(self._indicator_ovals[canvas], fill=color)
+
+    def _set_if_changed(self, var, value):
+        """Set a Tk variable only when the value differs from the last one set through here."""
+        name = str(var)
+        if self._var_values.get(name) != value:
+            self._var_values[name] = value
+            var.set(value)
 
     def _update_message_lists(self, messages_1047, messages_887):
         """Update the message listboxes on the main thread."""
+        self._fill_message_listbox(self.msg_1047_listbox, messages_1047)
+        self._fill_message_listbox(self.msg_887_listbox, messages_887)
+
+    def _fill_message_listbox(self, listbox, messages):
+        """Show messages in a listbox, skipping the redraw when nothing changed."""
+        rows = tuple(messages) if messages else ("(No messages)",)
+        shown = self._listbox_rows.get(listbox)
+        if shown == rows:
+            return
         try:
-            # Station 1047
-            self.msg_1047_listbox.delete(0, tk.END)
-            if messages_1047:
-                for msg in messages_1047:
-                    self.msg_1047_listbox.insert(tk.END, msg)
-            else:
-                self.msg_1047_listbox.insert(tk.END, "(No messages)")
-        except Exception as e:
-            self.msg_1047_listbox.delete(0, tk.END)
-            self.msg_1047_listbox.insert(tk.END, f"(Error: {e})")
-
-        try:
-            # Station 887
-            self.msg_887_listbox.delete(0, tk.END)
-            if messages_887:
-                for msg in messages_887:
-                    self.msg_887_listbox.insert(tk.END, msg)
+            if shown is None:
+                listbox.delete(0, tk.END)
+                listbox.insert(tk.END, *rows)
             else:
-                self.msg_887_listbox.insert(tk.END, "(No messages)")
+                # Replace only the rows between the unchanged prefix and suffix, so
+                # a cycle that advanced by one message touches a single row
+                limit = min(len(shown), len(rows))
+                start = 0
+                while start < limit and shown[start] == rows[start]:
+                    start += 1
+                end = 0
+                while end < limit - start and shown[-1 - end] == rows[-1 - end]:
+                    end += 1
+                if len(shown) - end > start:
+                    listbox.delete(start, len(shown) - end - 1)
+                if len(rows) - end > start:
+                    listbox.insert(start, *rows[start:len(rows) - end])
+            self._listbox_rows[listbox] = rows
         except Exception as e:
-            self.msg_887_listbox.delete(0, tk.END)
-            self.msg_887_listbox.insert(tk.END, f"(Error: {e})")
+            self._listbox_rows.pop(listbox, None)
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, f"(Error: {e})")
 
-    def _log_messages_batch(self, widget, messages):
-        """Insert multiple timestamped messages into the given text widget in a single operation."""
-        if not messages:
+    def _log_messages_batch(self, widget, lines):
+        """Insert multiple display lines into the given text widget in a single operation."""
+        if not lines:
             return
 
-        widget.config(state=tk.NORMAL)
-        for message in messages:
-            timestamp = datetime.now().strftime('%I:%M:%S %p').lstrip('0').lower()
-            widget.insert(tk.END, f"[{timestamp}] {message}\n")
-        widget.config(state=tk.DISABLED)
+        # One Tk insert per batch instead of per line, through methods bound once
+        set_state, append = self._log_widget_methods[widget]
+        set_state(tk.NORMAL)
+        append("".join(lines))
+        self._trim_log_widget(widget)
+        set_state(tk.DISABLED)
+
+    def _log_timestamp(self, seconds):
+        """Return the display timestamp (e.g. '9:05:07 pm') for an epoch time, formatted once per second."""
+        second = int(seconds)
+        if second != self._ts_cache[0]:
+            # Built from the time fields directly: no strftime, and no locale-dependent %p
+            tm = time.localtime(second)
+            stamp = f"{tm.tm_hour % 12 or 12}:{tm.tm_min:02d}:{tm.tm_sec:02d} {'am' if tm.tm_hour < 12 else 'pm'}"
+            self._ts_cache = (second, stamp)
+        return self._ts_cache[1]
+
+    def _trim_log_widget(self, widget):
+        """Delete the oldest lines once the widget exceeds its line cap (widget must be NORMAL)."""
+        line_count = int(widget.index('end-1c').split('.')[0])
+        if line_count <= self.MAX_LOG_LINES + self.LOG_TRIM_SLACK:
+            return
+        removed = line_count - self.MAX_LOG_LINES
+        widget.delete('1.0', f'{removed + 1}.0')
+        # Cached search match positions refer to line numbers that just moved up
+        if self._search_pattern and widget is self._get_current_log_widget():
+            self._shift_search_matches(widget, removed)
+
+    def _shift_search_matches(self, widget, removed):
+        """Move cached search matches up after removed lines were deleted from the top of widget."""
+        kept = []
+        current = -1
+        for index, (pos, end_pos) in enumerate(self._search_matches):
+            line, _, column = pos.partition('.')
+            line = int(line) - removed
+            if line < 1:
+                continue  # Deleted along with its line (the tags went with the text)
+            if index == self._search_current_index:
+                current = len(kept)
+            new_pos = f"{line}.{column}"
+            kept.append((new_pos, new_pos + end_pos[len(pos):]))
+        self._search_matches = kept
+
+        if not kept:
+            self._search_current_index = -1
+            self.search_match_label.config(text="No matches")
+            return
+        self._search_current_index = max(current, 0)
+        if current < 0:
+            # The current match was trimmed away - make the oldest remaining one current
+            self._highlight_current_match(widget)
+        current = self._search_current_index
+        self.search_match_label.config(text=f"{current + 1}/{len(kept)}")
 
     def _log_message(self, widget, message):
         """Insert a timestamped message into the given text widget."""
-        self._log_messages_batch(widget, [message])
+        self._log_messages_batch(widget, [f"[{self._log_timestamp(time.time())}] {message}\n"])
 
     def _pause_scroll(self):
         """Pause auto-scrolling of log widgets."""
@@ -883,10 +1140,10 @@ Enhanced with XML-Confirmed Ad Reporting
     def _jump_to_bottom(self):
         """Scroll all log widgets to the bottom and re-enable auto-scroll."""
         self.auto_scroll_enabled = True
-        for widget in [self.rds_1047_log_text, self.intro_1047_log_text, self.ad_1047_log_text,
-                       self.rds_887_log_text, self.intro_887_log_text, self.ad_887_log_text,
-                       self.auto_picker_log_text]:
-            widget.see(tk.END)
+        # Share the coalesced idle scroll pass with incoming log batches
+        if not self._scroll_pending:
+            self.after_idle(self._scroll_pending_to_end)
+        self._scroll_pending.update(self.log_widgets.values())
 
     def _toggle_logs(self):
         """Toggle the visibility of the log area."""
@@ -921,17 +1178,8 @@ Enhanced with XML-Confirmed Ad Reporting
 
     def _get_current_log_widget(self):
         """Get the Text widget for the currently selected log tab."""
-        tab_index = self.log_notebook.index(self.log_notebook.select())
-        widgets = [
-            self.rds_1047_log_text,
-            self.intro_1047_log_text,
-            self.ad_1047_log_text,
-            self.rds_887_log_text,
-            self.intro_887_log_text,
-            self.ad_887_log_text,
-            self.auto_picker_log_text
-        ]
-        return widgets[tab_index] if 0 <= tab_index < len(widgets) else None
+        # _visible_log_source follows <<NotebookTabChanged>>, so no Tcl query is needed
+        return self.log_widgets[self._visible_log_source]
 
     def _show_search(self):
         """Show the floating search bar."""
@@ -1038,9 +1286,7 @@ Enhanced with XML-Confirmed Ad Reporting
 
     def _clear_search_state(self):
         """Clear search highlights and reset state (keeps entry text)."""
-        for widget in [self.rds_1047_log_text, self.intro_1047_log_text, self.ad_1047_log_text,
-                       self.rds_887_log_text, self.intro_887_log_text, self.ad_887_log_text,
-                       self.auto_picker_log_text]:
+        for widget in self.log_widgets.values():
             self._clear_search_highlights(widget)
 
         self._search_matches = []
@@ -1073,7 +1319,10 @@ Enhanced with XML-Confirmed Ad Reporting
         threading.Thread(target=self.auto_picker_handler.reindex, daemon=True).start()
 
     def _on_tab_changed(self, event=None):
-        """Handle tab change - re-run search on new tab."""
+        """Handle tab change - show logs held while hidden and re-run search on new tab."""
+        self._visible_log_source = self._log_sources[self.log_notebook.index(self.log_notebook.select())]
+        self._flush_hidden_logs(self._visible_log_source)
+
         # Clear highlights on all tabs, then re-search on new tab
         self._clear_search_state()
         if self._search_visible and self.search_entry.get().strip():
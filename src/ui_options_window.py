@@ -377,7 +377,7 @@ class OptionsWindow(Toplevel):
         logging.info(f"Debug logging {status}")
         
         # Save setting to config
-        self.config_manager.update_setting("settings.debug.enable_debug_logs", enable_debug)
+        self.config_manager.update_shared_setting("debug.enable_debug_logs", enable_debug)
         try:
             self.config_manager.save_config()
         except Exception as e:
@@ -884,7 +884,7 @@ class OptionsWindow(Toplevel):
         logging_frame.pack(fill=tk.X, pady=(0, 10))
 
         self.enable_debug_logs_var = tk.BooleanVar(
-            value=self.config_manager.get_setting("settings.debug.enable_debug_logs", False)
+            value=self.config_manager.get_shared_setting("debug.enable_debug_logs", False)
         )
 
         debug_checkbox = ttk.Checkbutton(